@@ -5,7 +5,17 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .parser import get_available_tables, get_mdb, get_table_data
+from .exporters import DataExporter
+from .parser import (
+    get_available_tables,
+    get_mdb,
+    get_table_data,
+    get_table_names,
+    get_table_row_count,
+    parse_table_data,
+    parse_tables_parallel,
+)
+from .utils import ExportFormat
 from .utils import export_tables as dump_tables
 
 
@@ -42,7 +52,10 @@ class MerlinDB:
         """
         self.file_path = str(file_path)
         self._db = None
-        self._available_tables = None
+        self._available_tables: list[str] | None = None
+        self._table_set: frozenset[str] | None = None
+        self._table_cache: dict[str, dict[str, Any]] = {}
+        self._exporters: dict[ExportFormat, DataExporter] = {}
 
         # Validate file exists
         if not Path(file_path).exists():
@@ -60,9 +73,15 @@ class MerlinDB:
             Sorted list of table names
         """
         if self._available_tables is None:
-            self._available_tables = get_available_tables(self._db)
+            self._available_tables = sorted(self._get_table_set())
         return self._available_tables.copy()
 
+    def _get_table_set(self) -> frozenset[str]:
+        """Get the table names as a frozenset, loading them on first use."""
+        if self._table_set is None:
+            self._table_set = frozenset(get_available_tables(self._db))
+        return self._table_set
+
     def get_table(self, table_name: str, validate: bool = False) -> dict[str, Any]:
         """Get data from a specific table.
 
@@ -83,7 +102,42 @@ class MerlinDB:
             # Get validated data (if Pydantic model exists)
             config_data = db.get_table("Config", validate=True)
         """
-        return get_table_data(self._db, table_name, validate=validate)
+        return get_table_data(self._db, table_name, validate=validate, cache=self._table_cache)
+
+    def preload(self, tables: list[str] | None = None, workers: int | None = None) -> None:
+        """Parse tables up front so later reads are served from the table cache.
+
+        Args:
+            tables: Names of tables to preload (None for all tables)
+            workers: Number of processes to parse tables in parallel (None or 1 parses
+                in this process)
+
+        Raises:
+            ValueError: If a table doesn't exist or cannot be parsed
+
+        Examples:
+            # Parse everything once before repeated access
+            db.preload()
+
+            # Only warm the tables you need
+            db.preload(["Config", "Events"])
+
+            # Spread a large database over four processes
+            db.preload(workers=4)
+        """
+        pending = [
+            table_name
+            for table_name in (tables if tables is not None else self.list_tables())
+            if table_name not in self._table_cache
+        ]
+
+        if not workers or workers <= 1 or len(pending) < 2:
+            for table_name in pending:
+                # Store the parsed columns directly; get_table() would copy them
+                self._table_cache[table_name] = parse_table_data(self._db, table_name)
+            return
+
+        self._table_cache.update(parse_tables_parallel(self.file_path, pending, workers))
 
     def export_json(
         self, output_path: str | Path, tables: list[str] | None = None, separate_files: bool = False
@@ -114,6 +168,8 @@ class MerlinDB:
             format_name="json",
             tables=tables,
             single_file=not separate_files,
+            table_cache=self._table_cache,
+            exporter_cache=self._exporters,
         )
 
     def export_yaml(
@@ -142,6 +198,8 @@ class MerlinDB:
             format_name="yaml",
             tables=tables,
             single_file=not separate_files,
+            table_cache=self._table_cache,
+            exporter_cache=self._exporters,
         )
 
     def export_csv(
@@ -170,6 +228,8 @@ class MerlinDB:
             format_name="csv",
             tables=tables,
             single_file=not separate_files,
+            table_cache=self._table_cache,
+            exporter_cache=self._exporters,
         )
 
     def export(
@@ -205,6 +265,8 @@ class MerlinDB:
             format_name=format,
             tables=tables,
             single_file=not separate_files,
+            table_cache=self._table_cache,
+            exporter_cache=self._exporters,
         )
 
     def table_exists(self, table_name: str) -> bool:
@@ -216,7 +278,7 @@ class MerlinDB:
         Returns:
             True if table exists, False otherwise
         """
-        return table_name in self.list_tables()
+        return table_name in self._get_table_set()
 
     def get_table_info(self, table_name: str) -> dict[str, Any]:
         """Get metadata about a table.
@@ -271,14 +333,11 @@ class MerlinDB:
 
         for table_name in tables:
             try:
-                data = self.get_table(table_name, validate=False)
-                if data:
-                    columns = list(data.keys())
-                    if columns:
-                        record_count = len(data[columns[0]])
-                        total_records += record_count
-                        if record_count > 0:
-                            tables_with_data += 1
+                # Row counts come from the table headers, so no rows are parsed here
+                record_count = get_table_row_count(self._db, table_name)
+                total_records += record_count
+                if record_count > 0:
+                    tables_with_data += 1
 
                 if table_name in model_map:
                     tables_with_models += 1
@@ -321,8 +380,8 @@ class MerlinDB:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        # Clean up resources if needed
-        pass
+        # Drop parsed tables so their memory can be reclaimed
+        self._table_cache.clear()
 
 
 # Convenience functions for quick access
@@ -379,9 +438,15 @@ def list_tables(mdb_file: str | Path) -> list[str]:
     Example:
         tables = list_tables("database.mdb")
         print(f"Found {len(tables)} tables")
+
+    Raises:
+        FileNotFoundError: If MDB file doesn't exist
+        ValueError: If MDB file cannot be loaded
     """
-    with MerlinDB(mdb_file) as db:
-        return db.list_tables()
+    if not Path(mdb_file).exists():
+        raise FileNotFoundError(f"MDB file not found: {mdb_file}")
+
+    return get_table_names(str(mdb_file))
 
 
 def get_database_info(mdb_file: str | Path) -> dict[str, Any]:
@@ -1,5 +1,7 @@
 """Command-line interface for MerlinDB with comprehensive functionality."""
 
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import Annotated
 
@@ -9,7 +11,9 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from merlindb.api import list_tables as list_table_names
 from merlindb.api import load_database
+from merlindb.utils import select_tables
 
 console = Console()
 app = typer.Typer(
@@ -109,8 +113,12 @@ def list_tables(
     """
     try:
         with console.status("[bold blue]Loading database..."):
-            db = load_database(file_path)
-            tables = db.list_tables()
+            if show_info:
+                db = load_database(file_path)
+                tables = db.list_tables()
+            else:
+                # Listing names alone doesn't need a fully loaded database
+                tables = list_table_names(file_path)
 
         # Filter by pattern if provided
         if pattern:
@@ -155,8 +163,14 @@ def list_tables(
         else:
             # Simple table listing
             console.print(f"[bold]Available Tables ({len(tables)}):[/bold]\n")
-            for i, table_name in enumerate(tables, 1):
-                console.print(f"  {i:2d}. [cyan]{table_name}[/cyan]")
+            # Render the whole listing in one print call instead of one per table
+            if tables:
+                console.print(
+                    "\n".join(
+                        f"  {i:2d}. [cyan]{table_name}[/cyan]"
+                        for i, table_name in enumerate(tables, 1)
+                    )
+                )
 
             if pattern:
                 console.print(f"\n[dim]Filtered by pattern: {pattern}[/dim]")
@@ -196,9 +210,10 @@ def inspect_table(
 
             if not db.table_exists(table_name):
                 console.print(f"[red]❌ Table '{table_name}' not found[/red]")
-                similar = [t for t in db.list_tables() if table_name.lower() in t.lower()]
+                needle = table_name.lower()
+                similar = list(islice((t for t in db.list_tables() if needle in t.lower()), 5))
                 if similar:
-                    console.print(f"[yellow]Did you mean: {', '.join(similar[:5])}?[/yellow]")
+                    console.print(f"[yellow]Did you mean: {', '.join(similar)}?[/yellow]")
                 raise typer.Exit(1)
 
             # Get table info
@@ -237,15 +252,22 @@ def inspect_table(
                 )
 
                 table = Table(show_header=True, header_style="bold magenta")
-                for col in columns[:10]:  # Show first 10 columns
+                shown_columns = columns[:10]  # Show first 10 columns
+                for col in shown_columns:
                     table.add_column(col, style="white", overflow="fold")
 
                 num_records = min(limit, len(data[columns[0]]) if columns and data else 0)
-                for i in range(num_records):
-                    row = []
-                    for col in columns[:10]:
-                        value = data[col][i] if i < len(data[col]) else None
-                        row.append(str(value) if value is not None else "(null)")
+
+                # Stringify each column's preview slice once, padding short columns with nulls
+                preview_columns = [
+                    [
+                        str(value) if value is not None else "(null)"
+                        for value in data[col][:num_records]
+                    ]
+                    + ["(null)"] * (num_records - len(data[col]))
+                    for col in shown_columns
+                ]
+                for row in zip(*preview_columns, strict=True):
                     table.add_row(*row)
 
                 console.print(table)
@@ -274,6 +296,9 @@ def export(
     validate: Annotated[
         bool, typer.Option("--validate", "-v", help="Apply Pydantic validation during export")
     ] = False,
+    workers: Annotated[
+        int, typer.Option("--workers", "-w", help="Processes used to parse tables in parallel")
+    ] = 1,
 ):
     """Export database tables to various formats.
 
@@ -290,23 +315,31 @@ def export(
 
         # Export with validation
         merlin-db export database.mdb output.json --validate
+
+        # Parse tables across four processes
+        merlin-db export database.mdb output.json --workers 4
     """
     try:
         with console.status("[bold blue]Loading database..."):
             db = load_database(file_path)
+            if workers > 1:
+                db.preload(select_tables(db.list_tables(), tables), workers=workers)
 
         # Override get_table method if validation requested
         if validate:
             original_get_table = db.get_table
             db.get_table = lambda name, validate=False: original_get_table(name, validate=True)
 
+        export_methods = {
+            "json": db.export_json,
+            "yaml": db.export_yaml,
+            "csv": db.export_csv,
+        }
+
         with console.status("[bold blue]Exporting data..."):
-            if format.lower() == "json":
-                result = db.export_json(output, tables=tables, separate_files=separate_files)
-            elif format.lower() == "yaml":
-                result = db.export_yaml(output, tables=tables, separate_files=separate_files)
-            elif format.lower() == "csv":
-                result = db.export_csv(output, tables=tables, separate_files=separate_files)
+            export_method = export_methods.get(format.lower())
+            if export_method is not None:
+                result = export_method(output, tables=tables, separate_files=separate_files)
             else:
                 result = db.export(
                     output, format=format, tables=tables, separate_files=separate_files
@@ -394,11 +427,11 @@ def validate_data(
 
         # Display results
         if summary_only:
-            success_count = sum(1 for r in validation_results.values() if r["status"] == "success")
-            no_model_count = sum(
-                1 for r in validation_results.values() if r["status"] == "no_model"
-            )
-            error_count = sum(1 for r in validation_results.values() if r["status"] == "error")
+            # Tally every status in a single pass over the results
+            status_counts = Counter(r["status"] for r in validation_results.values())
+            success_count = status_counts["success"]
+            no_model_count = status_counts["no_model"]
+            error_count = status_counts["error"]
             total_validated_records = sum(
                 r["records"] for r in validation_results.values() if r["status"] == "success"
             )
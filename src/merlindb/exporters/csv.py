@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import csv
+import os
+from itertools import repeat
 from pathlib import Path
+from typing import Any, TextIO
 
-import pandas as pd
 from typing_extensions import override
 
 from .base import DataExporter
 
+# Write through a large buffer so big tables go out in few write calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CSVExporter(DataExporter):
     """CSV exporter for table data with single and multi-table support."""
@@ -46,16 +52,11 @@ class CSVExporter(DataExporter):
 
         table_data = self.get_table_data(table_name)
 
-        if not table_data:
-            # Create empty CSV with headers
-            pd.DataFrame().to_csv(output_path, index=False)
-            return
-
-        # Convert to pandas DataFrame for easy CSV export
-        df = pd.DataFrame(table_data)
-
-        # Write to CSV with UTF-8 encoding
-        df.to_csv(output_path, index=False, encoding="utf-8")
+        with self._open_csv(output_path) as f:
+            writer = self._make_writer(f)
+            # An empty table still gets a (blank) header line
+            writer.writerow(table_data.keys())
+            writer.writerows(zip(*table_data.values(), strict=False))
 
     @override
     def export_multiple_tables(
@@ -83,30 +84,29 @@ class CSVExporter(DataExporter):
         """Export multiple tables to a single CSV file with table separators."""
         self.ensure_output_directory(output_path)
 
-        combined_data = []
+        tables = [(table_name, self.get_table_data(table_name)) for table_name in table_names]
+        last_index = len(tables) - 1
 
-        for i, table_name in enumerate(table_names):
-            table_data = self.get_table_data(table_name)
+        # Header is the table identifier followed by every column in first-seen order
+        header = list(dict.fromkeys(col for _, data in tables for col in data))
+        if any(data for _, data in tables):
+            header.insert(0, "table_name")
 
-            if table_data:
-                df = pd.DataFrame(table_data)
+        with self._open_csv(output_path) as f:
+            writer = self._make_writer(f)
+            writer.writerow(header)
 
-                # Add table identifier column
-                df.insert(0, "table_name", table_name)
-                combined_data.append(df)
+            for i, (table_name, table_data) in enumerate(tables):
+                if not table_data:
+                    continue
 
-            # Add separator row between tables (except for the last table)
-            if i < len(table_names) - 1 and table_data:
-                separator_data = {col: "---" for col in ["table_name"] + list(table_data.keys())}
-                separator_df = pd.DataFrame([separator_data])
-                combined_data.append(separator_df)
+                writer.writerows(self._combined_rows(table_name, table_data, header))
 
-        if combined_data:
-            final_df = pd.concat(combined_data, ignore_index=True)
-            final_df.to_csv(output_path, index=False, encoding="utf-8")
-        else:
-            # Create empty CSV if no data
-            pd.DataFrame().to_csv(output_path, index=False)
+                # Add separator row between tables (except for the last table)
+                if i < last_index:
+                    writer.writerow(
+                        "---" if col == "table_name" or col in table_data else "" for col in header
+                    )
 
     def _export_multiple_separate_files(self, table_names: list[str], output_path: Path) -> None:
         """Export multiple tables to separate CSV files."""
@@ -115,3 +115,28 @@ class CSVExporter(DataExporter):
         for table_name in table_names:
             file_path = base_path.parent / f"{base_path.name}_{table_name}.csv"
             self.export_single_table(table_name, file_path)
+
+    @staticmethod
+    def _combined_rows(
+        table_name: str, table_data: dict[str, Any], header: list[str]
+    ) -> zip[tuple[Any, ...]]:
+        """Lay one table's columns out under the combined header.
+
+        Columns the table doesn't have are filled with empty strings, so rows are
+        produced by transposing the columns without building any per-row dicts.
+        """
+        num_rows = len(next(iter(table_data.values())))
+        columns = [
+            table_data[col] if col in table_data else repeat("", num_rows) for col in header[1:]
+        ]
+        return zip(repeat(table_name, num_rows), *columns, strict=False)
+
+    @staticmethod
+    def _open_csv(output_path: Path) -> TextIO:
+        """Open a CSV output file for writing with a large write buffer."""
+        return output_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE)
+
+    @staticmethod
+    def _make_writer(f: TextIO) -> Any:
+        """Create a CSV writer using the platform line terminator."""
+        return csv.writer(f, lineterminator=os.linesep)
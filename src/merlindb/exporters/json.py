@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +9,10 @@ from typing_extensions import override
 
 from .base import DataExporter
 
+# Export payloads are built fresh from table data and cannot contain reference
+# cycles, so the encoder's circular-reference bookkeeping is skipped.
+_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False, check_circular=False)
+
 
 class JSONExporter(DataExporter):
     """JSON exporter for table data with single and multi-table support."""
@@ -58,8 +63,7 @@ class JSONExporter(DataExporter):
             "records": records,
         }
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, default=str, ensure_ascii=False)
+        self._write_json(export_data, output_path)
 
     @override
     def export_multiple_tables(
@@ -84,31 +88,48 @@ class JSONExporter(DataExporter):
             self._export_multiple_separate_files(table_names, output_path)
 
     def _export_multiple_single_file(self, table_names: list[str], output_path: Path) -> None:
-        """Export multiple tables to a single JSON file."""
-        self.ensure_output_directory(output_path)
-
-        tables_data = {}
-        total_records = 0
+        """Export multiple tables to a single JSON file.
 
-        for table_name in table_names:
-            table_data = self.get_table_data(table_name)
-            records = self._convert_to_records(table_data)
-            tables_data[table_name] = {
-                "columns": list(table_data.keys()) if table_data else [],
-                "record_count": len(records),
-                "records": records,
-            }
-            total_records += len(records)
-
-        export_data = {
-            "provider_mode": self.provider.get_mode_name(),
-            "table_count": len(table_names),
-            "total_records": total_records,
-            "tables": tables_data,
-        }
+        Record counts come from the tables' column lengths up front. Records are then
+        built and written one table at a time, so only one table's records are held in
+        memory. The file is written under a temporary name and only renamed into place
+        once every table is written, so a failure never leaves a truncated export.
+        """
+        self.ensure_output_directory(output_path)
 
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, default=str, ensure_ascii=False)
+        tables = [(table_name, self.get_table_data(table_name)) for table_name in table_names]
+        total_records = sum(len(next(iter(data.values()), ())) for _, data in tables)
+
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8") as f:
+                f.write(
+                    "{\n"
+                    f'  "provider_mode": {_ENCODER.encode(self.provider.get_mode_name())},\n'
+                    f'  "table_count": {len(table_names)},\n'
+                    f'  "total_records": {total_records},\n'
+                    '  "tables": {'
+                )
+
+                separator = "\n"
+                for table_name, table_data in tables:
+                    records = self._convert_to_records(table_data)
+                    table_entry = {
+                        "columns": list(table_data.keys()) if table_data else [],
+                        "record_count": len(records),
+                        "records": records,
+                    }
+                    # Nest the table's JSON two levels deep, as it sits under "tables"
+                    table_json = _ENCODER.encode(table_entry).replace("\n", "\n    ")
+                    f.write(f"{separator}    {_ENCODER.encode(table_name)}: {table_json}")
+                    separator = ",\n"
+
+                f.write("\n  }\n}" if tables else "}\n}")
+
+            temp_path.replace(output_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
     def _export_multiple_separate_files(self, table_names: list[str], output_path: Path) -> None:
         """Export multiple tables to separate JSON files."""
@@ -118,6 +139,11 @@ class JSONExporter(DataExporter):
             file_path = base_path.parent / f"{base_path.name}_{table_name}.json"
             self.export_single_table(table_name, file_path)
 
+    def _write_json(self, export_data: dict[str, Any], output_path: Path) -> None:
+        """Write export data to a JSON file."""
+        with output_path.open("w", encoding="utf-8") as f:
+            f.write(_ENCODER.encode(export_data))
+
     def _convert_to_records(self, table_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Convert table data from column-oriented to record-oriented format.
 
@@ -131,22 +157,12 @@ class JSONExporter(DataExporter):
             return []
 
         columns = list(table_data.keys())
-        if not columns:
-            return []
 
         # Get the number of rows from the first column
         num_rows = len(table_data[columns[0]])
 
-        records = []
-        for i in range(num_rows):
-            record = {}
-            for column in columns:
-                # Handle cases where columns might have different lengths
-                if i < len(table_data[column]):
-                    value = table_data[column][i]
-                    record[column] = value if value is not None else None
-                else:
-                    record[column] = None
-            records.append(record)
-
-        return records
+        # Pad shorter columns with None and transpose in one pass. Each row already
+        # has one value per column, so the per-row zip skips the strict= check.
+        padded = [chain(table_data[column], repeat(None)) for column in columns]
+        rows = islice(zip(*padded, strict=False), num_rows)
+        return [dict(zip(columns, row)) for row in rows]  # noqa: B905
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any
 
@@ -145,22 +146,12 @@ class YAMLExporter(DataExporter):
             return []
 
         columns = list(table_data.keys())
-        if not columns:
-            return []
 
         # Get the number of rows from the first column
         num_rows = len(table_data[columns[0]])
 
-        records = []
-        for i in range(num_rows):
-            record = {}
-            for column in columns:
-                # Handle cases where columns might have different lengths
-                if i < len(table_data[column]):
-                    value = table_data[column][i]
-                    record[column] = value if value is not None else None
-                else:
-                    record[column] = None
-            records.append(record)
-
-        return records
+        # Pad shorter columns with None and transpose in one pass. Each row already
+        # has one value per column, so the per-row zip skips the strict= check.
+        padded = [chain(table_data[column], repeat(None)) for column in columns]
+        rows = islice(zip(*padded, strict=False), num_rows)
+        return [dict(zip(columns, row)) for row in rows]  # noqa: B905
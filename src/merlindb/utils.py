@@ -3,11 +3,61 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+import weakref
+from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 from merlindb.exporters import CSVExporter, DataExporter, JSONExporter, YAMLExporter
-from merlindb.parser import get_available_tables, get_mdb, get_table_data
+from merlindb.parser import (
+    get_available_tables,
+    get_mdb,
+    get_table_data,
+    parse_tables_parallel,
+)
+
+
+class ExportFormat(StrEnum):
+    """Supported export formats."""
+
+    JSON = "json"
+    YAML = "yaml"
+    CSV = "csv"
+
+
+_EXPORTER_REGISTRY: dict[ExportFormat, type[DataExporter]] = {
+    ExportFormat.JSON: JSONExporter,
+    ExportFormat.YAML: YAMLExporter,
+    ExportFormat.CSV: CSVExporter,
+}
+
+# Exporters created without a caller-owned table cache, reused per database handle
+_EXPORTER_CACHE: weakref.WeakKeyDictionary[Any, dict[ExportFormat, DataExporter]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Simple provider-like object for backward compatibility with exporters
+class _LegacyRawProvider:
+    def __init__(self, database: Any, table_cache: dict[str, dict[str, Any]] | None = None) -> None:
+        self.db = database
+        self.table_cache = table_cache
+
+    @cached_property
+    def _available_tables(self) -> list[str]:
+        return get_available_tables(self.db)
+
+    def get_available_tables(self) -> list[str]:
+        return self._available_tables.copy()
+
+    def get_table_data(self, table_name: str) -> dict[str, Any]:
+        return get_table_data(self.db, table_name, cache=self.table_cache)
+
+    def get_mode_name(self) -> str:
+        return "raw"
 
 
 # This file is kept for backward compatibility but functionality has been moved to parser.py
@@ -18,6 +68,9 @@ def export_tables(
     mode: str = "raw",  # Keep for backward compatibility, but ignored
     tables: list[str] | None = None,
     single_file: bool = True,
+    table_cache: dict[str, dict[str, Any]] | None = None,
+    workers: int | None = None,
+    exporter_cache: dict[ExportFormat, DataExporter] | None = None,
 ) -> dict[str, Any]:
     """Export database tables to files.
 
@@ -28,6 +81,11 @@ def export_tables(
         mode: Mode (ignored, kept for backward compatibility)
         tables: List of table patterns to export or None for all tables
         single_file: If True, export to single file. If False, create separate files.
+        table_cache: Optional dict of already-parsed tables to read from and fill in
+        workers: Number of processes to parse the selected tables in parallel before
+            exporting them (None or 1 parses them in this process)
+        exporter_cache: Optional dict of exporters to reuse, kept by the caller
+            alongside table_cache
 
     Returns:
         Dictionary with export results and metadata
@@ -42,12 +100,21 @@ def export_tables(
         # Select which tables to export
         selected_tables = select_tables(available_tables, tables)
 
+        if workers and workers > 1:
+            # Tables parse independently, so spread them over processes up front
+            if table_cache is None:
+                table_cache = {}
+            pending = [table for table in selected_tables if table not in table_cache]
+            if len(pending) > 1:
+                table_cache.update(parse_tables_parallel(db_path, pending, workers))
+
         # Get exporter for the specified format
-        exporter = get_exporter(db, format_name)
+        exporter = get_exporter(
+            db, format_name, table_cache=table_cache, exporter_cache=exporter_cache
+        )
 
         # Prepare output path
         output_base = Path(output_path)
-        output_files = []
 
         if single_file:
             # Export all selected tables to a single file
@@ -59,9 +126,10 @@ def export_tables(
 
             # Build list of output files
             extension = exporter.get_file_extension()
-            for table in selected_tables:
-                table_file = output_base.parent / f"{output_base.stem}_{table}{extension}"
-                output_files.append(str(table_file))
+            output_files = [
+                str(output_base.parent / f"{output_base.stem}_{table}{extension}")
+                for table in selected_tables
+            ]
 
         return {
             "format": format_name,
@@ -94,12 +162,25 @@ def get_database_info(db_path: str) -> tuple[Any, list[str]]:
     return db, tables
 
 
-def get_exporter(db: Any, format_name: str) -> DataExporter:
+def get_exporter(
+    db: Any,
+    format_name: str,
+    table_cache: dict[str, dict[str, Any]] | None = None,
+    exporter_cache: dict[ExportFormat, DataExporter] | None = None,
+) -> DataExporter:
     """Get an exporter instance for the specified format.
 
+    Exporters are reused per database and format. A caller that passes its own
+    table_cache gets a fresh exporter unless it also passes an exporter_cache
+    to keep exporters bound to that table cache in. A cached exporter is rebuilt
+    if it was made for a different database or table cache.
+
     Args:
         db: Database instance
         format_name: Export format ('json', 'yaml', 'csv')
+        table_cache: Optional dict of already-parsed tables to read from and fill in
+        exporter_cache: Optional dict of exporters for this database and table_cache,
+            filled in on a miss
 
     Returns:
         DataExporter instance for the specified format
@@ -107,35 +188,38 @@ def get_exporter(db: Any, format_name: str) -> DataExporter:
     Raises:
         ValueError: If format is not supported
     """
-
-    # Create a simple provider-like object for backward compatibility with exporters
-    class SimpleDataProvider:
-        def __init__(self, database):
-            self.db = database
-
-        def get_available_tables(self) -> list[str]:
-            return get_available_tables(self.db)
-
-        def get_table_data(self, table_name: str) -> dict[str, Any]:
-            return get_table_data(self.db, table_name)
-
-        def get_mode_name(self) -> str:
-            return "raw"
-
-    provider = SimpleDataProvider(db)
-
-    exporters = {
-        "json": JSONExporter,
-        "yaml": YAMLExporter,
-        "csv": CSVExporter,
-    }
-
-    format_lower = format_name.lower()
-    if format_lower not in exporters:
-        available = ", ".join(exporters.keys())
-        raise ValueError(f"Unsupported format '{format_name}'. Available formats: {available}")
-
-    return exporters[format_lower](provider)
+    try:
+        export_format = ExportFormat(format_name.lower())
+    except ValueError:
+        available = ", ".join(fmt.value for fmt in ExportFormat)
+        raise ValueError(
+            f"Unsupported format '{format_name}'. Available formats: {available}"
+        ) from None
+
+    if exporter_cache is None:
+        if table_cache is not None:
+            return _EXPORTER_REGISTRY[export_format](_LegacyRawProvider(db, table_cache))
+
+        exporters = _EXPORTER_CACHE.setdefault(db, {})
+        exporter = exporters.get(export_format)
+        if exporter is None:
+            # The provider only holds a proxy so the cache entry doesn't keep the database alive
+            provider = _LegacyRawProvider(weakref.proxy(db))
+            exporter = exporters[export_format] = _EXPORTER_REGISTRY[export_format](provider)
+        return exporter
+
+    # A caller's cache can outlive the database handle it was filled for (a changed
+    # file is reopened as a new handle), so rebuild exporters bound to anything else
+    exporter = exporter_cache.get(export_format)
+    provider = exporter.provider if exporter is not None else None
+    if not (
+        isinstance(provider, _LegacyRawProvider)
+        and provider.db is db
+        and provider.table_cache is table_cache
+    ):
+        provider = _LegacyRawProvider(db, table_cache)
+        exporter = exporter_cache[export_format] = _EXPORTER_REGISTRY[export_format](provider)
+    return exporter
 
 
 def select_tables(
@@ -157,17 +241,30 @@ def select_tables(
         # Return all tables if no patterns specified
         return available_tables
 
+    # Index tables by lowercased name for case-insensitive exact matching
+    tables_by_lower: dict[str, list[str]] = {}
+    for table in available_tables:
+        tables_by_lower.setdefault(table.lower(), []).append(table)
+
     selected_tables = set()
+    wildcard_patterns = []
 
     for pattern in table_patterns:
-        # Support exact match and wildcard patterns
-        matches = fnmatch.filter(available_tables, pattern)
-        selected_tables.update(matches)
-
-        # Also try exact match (case-insensitive)
-        for table in available_tables:
-            if table.lower() == pattern.lower():
-                selected_tables.add(table)
+        # Exact match (case-insensitive)
+        selected_tables.update(tables_by_lower.get(pattern.lower(), ()))
+
+        # Only wildcard patterns need fnmatch
+        if any(char in pattern for char in "*?["):
+            wildcard_patterns.append(pattern)
+
+    if wildcard_patterns:
+        # Compile all wildcards into one regex and match each table once. Like
+        # fnmatch.filter, compare normcased names (case-insensitive on Windows).
+        normcase = os.path.normcase
+        combined = re.compile("|".join(fnmatch.translate(normcase(p)) for p in wildcard_patterns))
+        selected_tables.update(
+            table for table in available_tables if combined.match(normcase(table))
+        )
 
     selected_list = sorted(selected_tables)
 
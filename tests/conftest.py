@@ -0,0 +1,62 @@
+"""Shared pytest fixtures."""
+
+import logging
+
+import pytest
+
+from merlindb.models.genisys import model_map
+from merlindb.parser import get_available_tables, get_mdb
+from merlindb.utils import get_database_info
+
+# Test data file in project root
+TEST_DB_PATH = "test.mdb"
+
+
+@pytest.fixture(scope="session")
+def db():
+    """Open the test database once for the whole session."""
+    db = get_mdb(TEST_DB_PATH)
+    assert db is not None, f"Failed to load {TEST_DB_PATH}"
+    return db
+
+
+@pytest.fixture(scope="session")
+def available_tables(db):
+    """Sorted table names of the session test database."""
+    return get_available_tables(db)
+
+
+@pytest.fixture(scope="session")
+def tables_with_models(available_tables):
+    """Tables of the session test database that have a Pydantic model."""
+    return [table_name for table_name in available_tables if table_name in model_map]
+
+
+@pytest.fixture
+def first_modeled_table(tables_with_models):
+    """First table with a Pydantic model, skipping the test if there is none."""
+    if not tables_with_models:
+        pytest.skip("No tables with Pydantic models found in test data")
+    return tables_with_models[0]
+
+
+@pytest.fixture(scope="session")
+def table_cache():
+    """Raw tables parsed so far, so each one is read from the file only once.
+
+    Pass as get_table_data(..., cache=table_cache); validated reads are derived
+    from the cached raw data instead of parsing the table again.
+    """
+    return {}
+
+
+@pytest.fixture(scope="session")
+def test_db():
+    """Parse the test database once and share (db, tables) across the session."""
+    return get_database_info(TEST_DB_PATH)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def quiet_access_parser():
+    """Suppress access-parser logging during tests."""
+    logging.getLogger("access_parser").setLevel(logging.ERROR)
@@ -1,16 +1,12 @@
 """Test the programmatic Python API interface."""
 
 import json
-import logging
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
 import yaml
 
-# Suppress access-parser logging during tests
-logging.getLogger("access_parser").setLevel(logging.ERROR)
-
 from merlindb import (
     MerlinDB,
     get_database_info,
@@ -22,6 +18,15 @@ from merlindb import (
 # Test data file in project root
 TEST_DB_PATH = "test.mdb"
 
+# Read exported YAML back with the libyaml C loader when PyYAML was built with it
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@pytest.fixture(scope="session")
+def merlin_db():
+    """Share one MerlinDB instance across tests that don't exercise initialization."""
+    return MerlinDB(TEST_DB_PATH)
+
 
 class TestMerlinDBClass:
     """Test the main MerlinDB class."""
@@ -41,21 +46,17 @@ class TestMerlinDBClass:
         with pytest.raises(FileNotFoundError, match="MDB file not found"):
             MerlinDB("nonexistent.mdb")
 
-    def test_initialization_invalid_file(self):
+    def test_initialization_invalid_file(self, tmp_path):
         """Test initialization with invalid MDB file."""
-        with tempfile.NamedTemporaryFile(suffix=".mdb", delete=False) as temp_file:
-            temp_file.write(b"invalid content")
-            temp_file.flush()
-
-            with pytest.raises(ValueError, match="Failed to load MDB file"):
-                MerlinDB(temp_file.name)
+        invalid_file = tmp_path / "invalid.mdb"
+        invalid_file.write_bytes(b"invalid content")
 
-            Path(temp_file.name).unlink()
+        with pytest.raises(ValueError, match="Failed to load MDB file"):
+            MerlinDB(invalid_file)
 
-    def test_list_tables(self):
+    def test_list_tables(self, merlin_db):
         """Test listing available tables."""
-        db = MerlinDB(TEST_DB_PATH)
-        tables = db.list_tables()
+        tables = merlin_db.list_tables()
 
         assert isinstance(tables, list)
         assert len(tables) > 0
@@ -64,44 +65,36 @@ class TestMerlinDBClass:
         assert tables == sorted(tables)  # Should be sorted
 
         # Should return a copy, not reference
-        tables2 = db.list_tables()
+        tables2 = merlin_db.list_tables()
         assert tables == tables2
         assert tables is not tables2
 
-    def test_get_table_success(self):
+    def test_get_table_success(self, merlin_db):
         """Test getting table data successfully."""
-        db = MerlinDB(TEST_DB_PATH)
-
         # Test without validation
-        config_data = db.get_table("Config")
+        config_data = merlin_db.get_table("Config")
         assert isinstance(config_data, dict)
         assert len(config_data) > 0
 
         # Test with validation
-        config_validated = db.get_table("Config", validate=True)
+        config_validated = merlin_db.get_table("Config", validate=True)
         assert isinstance(config_validated, dict)
-        assert set(config_data.keys()) == set(config_validated.keys())
+        assert config_data.keys() == config_validated.keys()
 
-    def test_get_table_invalid_table(self):
+    def test_get_table_invalid_table(self, merlin_db):
         """Test error handling for invalid table names."""
-        db = MerlinDB(TEST_DB_PATH)
-
         with pytest.raises(ValueError, match="Table 'NonExistentTable' not found"):
-            db.get_table("NonExistentTable")
+            merlin_db.get_table("NonExistentTable")
 
-    def test_table_exists(self):
+    def test_table_exists(self, merlin_db):
         """Test table existence checking."""
-        db = MerlinDB(TEST_DB_PATH)
+        assert merlin_db.table_exists("Config") is True
+        assert merlin_db.table_exists("GeniSysObjects") is True
+        assert merlin_db.table_exists("NonExistentTable") is False
 
-        assert db.table_exists("Config") is True
-        assert db.table_exists("GeniSysObjects") is True
-        assert db.table_exists("NonExistentTable") is False
-
-    def test_get_table_info(self):
+    def test_get_table_info(self, merlin_db):
         """Test getting table metadata."""
-        db = MerlinDB(TEST_DB_PATH)
-
-        info = db.get_table_info("Config")
+        info = merlin_db.get_table_info("Config")
         assert isinstance(info, dict)
         assert info["name"] == "Config"
         assert isinstance(info["columns"], list)
@@ -110,17 +103,14 @@ class TestMerlinDBClass:
         assert isinstance(info["has_pydantic_model"], bool)
         assert info["column_count"] == len(info["columns"])
 
-    def test_get_table_info_invalid_table(self):
+    def test_get_table_info_invalid_table(self, merlin_db):
         """Test table info for non-existent table."""
-        db = MerlinDB(TEST_DB_PATH)
-
         with pytest.raises(ValueError, match="Table 'NonExistentTable' not found"):
-            db.get_table_info("NonExistentTable")
+            merlin_db.get_table_info("NonExistentTable")
 
-    def test_get_database_summary(self):
+    def test_get_database_summary(self, merlin_db):
         """Test getting database summary."""
-        db = MerlinDB(TEST_DB_PATH)
-        summary = db.get_database_summary()
+        summary = merlin_db.get_database_summary()
 
         assert isinstance(summary, dict)
         assert summary["file_path"] == TEST_DB_PATH
@@ -134,109 +124,132 @@ class TestMerlinDBClass:
         assert summary["total_records"] > 0
         assert "%" in summary["model_coverage"]
 
-    def test_export_json(self):
-        """Test JSON export functionality."""
+    def test_preload(self):
+        """Test preloading tables before reading them."""
         db = MerlinDB(TEST_DB_PATH)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.json"
+        db.preload(["Config"])
+        assert db.get_table("Config") == MerlinDB(TEST_DB_PATH).get_table("Config")
 
-            result = db.export_json(output_file, tables=["Config"])
+        db.preload()
+        assert db.get_table("Config") == db.get_table("Config")
 
-            assert result["format"] == "json"
-            assert result["tables_exported"] == 1
-            assert "Config" in result["table_names"]
-            assert output_file.exists()
+        with pytest.raises(ValueError, match="Table 'NonExistentTable' not found"):
+            db.preload(["NonExistentTable"])
 
-            # Verify JSON content
-            with open(output_file) as f:
-                data = json.load(f)
-                assert "tables" in data
-                assert "Config" in data["tables"]
+    def test_preload_parallel(self):
+        """Test preloading tables across worker processes."""
+        db = MerlinDB(TEST_DB_PATH)
 
-    def test_export_yaml(self):
-        """Test YAML export functionality."""
+        db.preload(["Config", "DeviceTypes"], workers=2)
+        assert db.get_table("Config") == MerlinDB(TEST_DB_PATH).get_table("Config")
+
+    def test_internal_caches(self, tmp_path):
+        """Test the private table and exporter caches behind preload() and exports."""
         db = MerlinDB(TEST_DB_PATH)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.yaml"
+        db.preload(["Config"])
+        assert set(db._table_cache) == {"Config"}
 
-            result = db.export_yaml(output_file, tables=["Config"])
+        db.preload(["Config", "DeviceTypes"], workers=2)
+        assert set(db._table_cache) == {"Config", "DeviceTypes"}
 
-            assert result["format"] == "yaml"
-            assert result["tables_exported"] == 1
-            assert output_file.exists()
+        db.preload()
+        assert set(db._table_cache) == set(db.list_tables())
 
-            # Verify YAML content
-            with open(output_file) as f:
-                data = yaml.safe_load(f)
-                assert "tables" in data
-                assert "Config" in data["tables"]
+        # Repeated exports reuse one exporter bound to the table cache
+        db.export_json(tmp_path / "first.json", tables=["Config"])
+        exporter = db._exporters["json"]
+        db.export_json(tmp_path / "second.json", tables=["Config"])
+        assert db._exporters["json"] is exporter
+        assert exporter.provider.table_cache is db._table_cache
 
-    def test_export_csv(self):
-        """Test CSV export functionality."""
-        db = MerlinDB(TEST_DB_PATH)
+    def test_export_json(self, merlin_db, tmp_path):
+        """Test JSON export functionality."""
+        output_file = tmp_path / "test.json"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.csv"
+        result = merlin_db.export_json(output_file, tables=["Config"])
 
-            result = db.export_csv(output_file, tables=["Config"])
+        assert result["format"] == "json"
+        assert result["tables_exported"] == 1
+        assert "Config" in result["table_names"]
+        assert output_file.exists()
 
-            assert result["format"] == "csv"
-            assert result["tables_exported"] == 1
-            assert output_file.exists()
+        # Verify JSON content
+        with open(output_file) as f:
+            data = json.load(f)
+            assert "tables" in data
+            assert "Config" in data["tables"]
 
-            # Verify CSV content
-            content = output_file.read_text()
-            assert len(content) > 0
+    def test_export_yaml(self, merlin_db, tmp_path):
+        """Test YAML export functionality."""
+        output_file = tmp_path / "test.yaml"
 
-    def test_export_generic(self):
-        """Test generic export method."""
-        db = MerlinDB(TEST_DB_PATH)
+        result = merlin_db.export_yaml(output_file, tables=["Config"])
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test different formats
-            for format_name, extension in [("json", ".json"), ("yaml", ".yaml"), ("csv", ".csv")]:
-                output_file = Path(temp_dir) / f"test{extension}"
+        assert result["format"] == "yaml"
+        assert result["tables_exported"] == 1
+        assert output_file.exists()
 
-                result = db.export(output_file, format=format_name, tables=["Config"])
+        # Verify YAML content
+        with open(output_file) as f:
+            data = yaml.load(f, Loader=YAMLLoader)
+            assert "tables" in data
+            assert "Config" in data["tables"]
 
-                assert result["format"] == format_name
-                assert result["tables_exported"] == 1
-                assert output_file.exists()
+    def test_export_csv(self, merlin_db, tmp_path):
+        """Test CSV export functionality."""
+        output_file = tmp_path / "test.csv"
 
-    def test_export_separate_files(self):
-        """Test export with separate files."""
-        db = MerlinDB(TEST_DB_PATH)
+        result = merlin_db.export_csv(output_file, tables=["Config"])
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.json"
+        assert result["format"] == "csv"
+        assert result["tables_exported"] == 1
+        assert output_file.exists()
 
-            result = db.export_json(
-                output_file, tables=["Config", "DeviceTypes"], separate_files=True
-            )
+        # Verify CSV content
+        content = output_file.read_text()
+        assert len(content) > 0
 
-            assert result["tables_exported"] == 2
-            assert len(result["output_files"]) == 2
+    @pytest.mark.parametrize("format_name", ["json", "yaml", "csv"])
+    def test_export_generic(self, merlin_db, tmp_path, format_name):
+        """Test generic export method."""
+        output_file = tmp_path / f"test.{format_name}"
 
-            # Check separate files exist
-            config_file = Path(temp_dir) / "test_Config.json"
-            device_types_file = Path(temp_dir) / "test_DeviceTypes.json"
-            assert config_file.exists()
-            assert device_types_file.exists()
+        result = merlin_db.export(output_file, format=format_name, tables=["Config"])
 
-    def test_export_with_wildcards(self):
-        """Test export with wildcard patterns."""
-        db = MerlinDB(TEST_DB_PATH)
+        assert result["format"] == format_name
+        assert result["tables_exported"] == 1
+        assert output_file.exists()
+
+    def test_export_separate_files(self, merlin_db, tmp_path):
+        """Test export with separate files."""
+        output_file = tmp_path / "test.json"
+
+        result = merlin_db.export_json(
+            output_file, tables=["Config", "DeviceTypes"], separate_files=True
+        )
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "genisys.json"
+        assert result["tables_exported"] == 2
+        assert len(result["output_files"]) == 2
 
-            result = db.export_json(output_file, tables=["GeniSys*"])
+        # Check separate files exist
+        config_file = tmp_path / "test_Config.json"
+        device_types_file = tmp_path / "test_DeviceTypes.json"
+        assert {entry.name for entry in os.scandir(tmp_path)} == {
+            config_file.name,
+            device_types_file.name,
+        }
 
-            assert result["tables_exported"] > 0
-            for table_name in result["table_names"]:
-                assert table_name.startswith("GeniSys")
+    def test_export_with_wildcards(self, merlin_db, tmp_path):
+        """Test export with wildcard patterns."""
+        output_file = tmp_path / "genisys.json"
+
+        result = merlin_db.export_json(output_file, tables=["GeniSys*"])
+
+        assert result["tables_exported"] > 0
+        for table_name in result["table_names"]:
+            assert table_name.startswith("GeniSys")
 
     def test_context_manager(self):
         """Test context manager functionality."""
@@ -247,10 +260,9 @@ class TestMerlinDBClass:
             data = db.get_table("Config")
             assert isinstance(data, dict)
 
-    def test_repr(self):
+    def test_repr(self, merlin_db):
         """Test string representation."""
-        db = MerlinDB(TEST_DB_PATH)
-        repr_str = repr(db)
+        repr_str = repr(merlin_db)
 
         assert "MerlinDB" in repr_str
         assert TEST_DB_PATH in repr_str
@@ -278,6 +290,11 @@ class TestConvenienceFunctions:
         assert len(tables) > 0
         assert "Config" in tables
 
+    def test_list_tables_function_file_not_found(self):
+        """Test list_tables convenience function with a missing file."""
+        with pytest.raises(FileNotFoundError, match="MDB file not found"):
+            list_tables("nonexistent.mdb")
+
     def test_get_database_info_function(self):
         """Test get_database_info convenience function."""
         info = get_database_info(TEST_DB_PATH)
@@ -287,67 +304,55 @@ class TestConvenienceFunctions:
         assert "total_records" in info
         assert info["file_path"] == TEST_DB_PATH
 
-    def test_quick_export(self):
+    def test_quick_export(self, tmp_path):
         """Test quick_export convenience function."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "quick.json"
+        output_file = tmp_path / "quick.json"
 
-            result = quick_export(TEST_DB_PATH, output_file, format="json", tables=["Config"])
+        result = quick_export(TEST_DB_PATH, output_file, format="json", tables=["Config"])
 
-            assert result["format"] == "json"
-            assert result["tables_exported"] == 1
-            assert output_file.exists()
+        assert result["format"] == "json"
+        assert result["tables_exported"] == 1
+        assert output_file.exists()
 
-    def test_quick_export_all_formats(self):
+    @pytest.mark.parametrize("format_name", ["json", "yaml", "csv"])
+    def test_quick_export_all_formats(self, tmp_path, format_name):
         """Test quick_export with all formats."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for format_name, extension in [("json", ".json"), ("yaml", ".yaml"), ("csv", ".csv")]:
-                output_file = Path(temp_dir) / f"quick{extension}"
+        output_file = tmp_path / f"quick.{format_name}"
 
-                result = quick_export(
-                    TEST_DB_PATH, output_file, format=format_name, tables=["Config"]
-                )
+        result = quick_export(TEST_DB_PATH, output_file, format=format_name, tables=["Config"])
 
-                assert result["format"] == format_name
-                assert output_file.exists()
+        assert result["format"] == format_name
+        assert output_file.exists()
 
 
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    def test_invalid_export_format(self):
+    def test_invalid_export_format(self, merlin_db, tmp_path):
         """Test error handling for invalid export format."""
-        db = MerlinDB(TEST_DB_PATH)
+        output_file = tmp_path / "test.xml"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.xml"
+        with pytest.raises(ValueError, match="Unsupported format"):
+            merlin_db.export(output_file, format="xml")
 
-            with pytest.raises(ValueError, match="Unsupported format"):
-                db.export(output_file, format="xml")
-
-    def test_invalid_table_patterns(self):
+    def test_invalid_table_patterns(self, merlin_db, tmp_path):
         """Test error handling for invalid table patterns."""
-        db = MerlinDB(TEST_DB_PATH)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.json"
+        output_file = tmp_path / "test.json"
 
-            with pytest.raises(ValueError, match="No tables found matching patterns"):
-                db.export_json(output_file, tables=["NonExistentPattern*"])
+        with pytest.raises(ValueError, match="No tables found matching patterns"):
+            merlin_db.export_json(output_file, tables=["NonExistentPattern*"])
 
-    def test_permission_errors(self):
+    def test_permission_errors(self, merlin_db):
         """Test handling of permission errors."""
-        db = MerlinDB(TEST_DB_PATH)
-
         # Try to write to root directory (should fail on most systems)
         with pytest.raises((PermissionError, OSError)):
-            db.export_json("/root/test.json", tables=["Config"])
+            merlin_db.export_json("/root/test.json", tables=["Config"])
 
 
 class TestIntegration:
     """Integration tests combining multiple API features."""
 
-    def test_full_workflow(self):
+    def test_full_workflow(self, tmp_path):
         """Test complete workflow: load -> inspect -> export."""
         # Load database
         db = load_database(TEST_DB_PATH)
@@ -366,54 +371,48 @@ class TestIntegration:
             assert info["name"] == "Config"
 
         # Export to all formats
-        with tempfile.TemporaryDirectory() as temp_dir:
-            for fmt in ["json", "yaml", "csv"]:
-                output_file = Path(temp_dir) / f"export.{fmt}"
-                result = db.export(output_file, format=fmt, tables=["Config"])
-                assert result["format"] == fmt
-                assert output_file.exists()
-
-    def test_data_consistency(self):
-        """Test data consistency across different access methods."""
-        db = MerlinDB(TEST_DB_PATH)
+        for fmt in ["json", "yaml", "csv"]:
+            output_file = tmp_path / f"export.{fmt}"
+            result = db.export(output_file, format=fmt, tables=["Config"])
+            assert result["format"] == fmt
+            assert output_file.exists()
 
+    def test_data_consistency(self, merlin_db, tmp_path):
+        """Test data consistency across different access methods."""
         # Get data through different methods
-        raw_data = db.get_table("Config", validate=False)
-        validated_data = db.get_table("Config", validate=True)
+        raw_data = merlin_db.get_table("Config", validate=False)
+        validated_data = merlin_db.get_table("Config", validate=True)
 
         # Should have same structure
-        assert set(raw_data.keys()) == set(validated_data.keys())
+        assert raw_data.keys() == validated_data.keys()
 
         # Export and re-import to verify consistency
-        with tempfile.TemporaryDirectory() as temp_dir:
-            json_file = Path(temp_dir) / "test.json"
+        json_file = tmp_path / "test.json"
 
-            # Export
-            result = db.export_json(json_file, tables=["Config"])
-            assert result["tables_exported"] == 1
+        # Export
+        result = merlin_db.export_json(json_file, tables=["Config"])
+        assert result["tables_exported"] == 1
 
-            # Read back
-            with open(json_file) as f:
-                exported_data = json.load(f)
+        # Read back
+        with open(json_file) as f:
+            exported_data = json.load(f)
 
-            assert "tables" in exported_data
-            assert "Config" in exported_data["tables"]
+        assert "tables" in exported_data
+        assert "Config" in exported_data["tables"]
 
-            # Compare structure
-            config_export = exported_data["tables"]["Config"]
-            assert "columns" in config_export
-            assert "records" in config_export
-            assert set(config_export["columns"]) == set(raw_data.keys())
+        # Compare structure
+        config_export = exported_data["tables"]["Config"]
+        assert "columns" in config_export
+        assert "records" in config_export
+        assert raw_data.keys() == set(config_export["columns"])
 
-    def test_large_dataset_handling(self):
+    def test_large_dataset_handling(self, merlin_db, tmp_path):
         """Test handling of larger datasets."""
-        db = MerlinDB(TEST_DB_PATH)
-
         # Find table with most data
         tables_info = {}
-        for table in db.list_tables()[:10]:  # Test first 10 tables
+        for table in merlin_db.list_tables()[:10]:  # Test first 10 tables
             try:
-                info = db.get_table_info(table)
+                info = merlin_db.get_table_info(table)
                 tables_info[table] = info["record_count"]
             except Exception:
                 continue
@@ -422,17 +421,16 @@ class TestIntegration:
             largest_table = max(tables_info.keys(), key=lambda t: tables_info[t])
 
             # Test with largest table
-            data = db.get_table(largest_table)
+            data = merlin_db.get_table(largest_table)
             assert isinstance(data, dict)
 
             # Export largest table
-            with tempfile.TemporaryDirectory() as temp_dir:
-                output_file = Path(temp_dir) / "large.json"
-                result = db.export_json(output_file, tables=[largest_table])
-                assert result["tables_exported"] == 1
-                assert output_file.exists()
+            output_file = tmp_path / "large.json"
+            result = merlin_db.export_json(output_file, tables=[largest_table])
+            assert result["tables_exported"] == 1
+            assert output_file.exists()
 
-    def test_batch_processing_simulation(self):
+    def test_batch_processing_simulation(self, tmp_path):
         """Test batch processing simulation."""
         # Simulate processing multiple MDB files
         test_files = [TEST_DB_PATH]  # In real scenario, would be multiple files
@@ -444,18 +442,17 @@ class TestIntegration:
                     summary = db.get_database_summary()
 
                     # Process each database
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        output_file = Path(temp_dir) / f"{Path(file_path).stem}.json"
-                        db.export_json(output_file)
-
-                        results.append(
-                            {
-                                "file": file_path,
-                                "tables": summary["total_tables"],
-                                "records": summary["total_records"],
-                                "export_status": "success",
-                            }
-                        )
+                    output_file = tmp_path / f"{Path(file_path).stem}.json"
+                    db.export_json(output_file)
+
+                    results.append(
+                        {
+                            "file": file_path,
+                            "tables": summary["total_tables"],
+                            "records": summary["total_records"],
+                            "export_status": "success",
+                        }
+                    )
 
             except Exception as e:
                 results.append({"file": file_path, "error": str(e), "export_status": "failed"})
@@ -486,19 +483,16 @@ class TestPerformance:
         assert list_time < 1.0  # 1 second max
         assert len(tables) > 0
 
-    def test_export_performance(self):
+    def test_export_performance(self, merlin_db, tmp_path):
         """Test export performance."""
         import time
 
-        db = MerlinDB(TEST_DB_PATH)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "perf_test.json"
+        output_file = tmp_path / "perf_test.json"
 
-            start_time = time.time()
-            result = db.export_json(output_file, tables=["Config", "DeviceTypes", "Events"])
-            export_time = time.time() - start_time
+        start_time = time.time()
+        result = merlin_db.export_json(output_file, tables=["Config", "DeviceTypes", "Events"])
+        export_time = time.time() - start_time
 
-            # Should complete within reasonable time
-            assert export_time < 10.0  # 10 seconds max
-            assert result["tables_exported"] == 3
+        # Should complete within reasonable time
+        assert export_time < 10.0  # 10 seconds max
+        assert result["tables_exported"] == 3
@@ -1,41 +1,78 @@
 """Test the new comprehensive CLI interface."""
 
-import logging
-import tempfile
-from pathlib import Path
-
-# Suppress access-parser logging during tests
-logging.getLogger("access_parser").setLevel(logging.ERROR)
+import importlib
+import re
 
+import pytest
+from rich.console import Console
 from typer.testing import CliRunner
 
-from merlindb.cli import app
-
 # Test data file in project root
 TEST_DB_PATH = "test.mdb"
-runner = CliRunner()
+
+# Plain, wide output: no styling to render and no wrapping to match around
+runner = CliRunner(env={"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "200"})
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Import the CLI app only once a test needs it."""
+    from merlindb.cli import app as cli_app
+
+    return cli_app
+
+
+@pytest.fixture(autouse=True)
+def plain_console(app, monkeypatch):
+    """Render CLI output without color or terminal features."""
+    # The package exposes the Typer app as merlindb.cli, so fetch the module itself
+    monkeypatch.setattr(
+        importlib.import_module("merlindb.cli"),
+        "console",
+        Console(no_color=True, force_terminal=False, width=200),
+    )
+
+
+def assert_output_contains(output: str, *expected: str) -> None:
+    """Assert that every expected fragment appears in the CLI output.
+
+    All fragments are found in a single regex pass; only fragments hidden inside
+    an overlapping match fall back to a plain substring check.
+    """
+    pattern = re.compile("|".join(re.escape(fragment) for fragment in expected))
+    found = set(pattern.findall(output))
+    missing = [
+        fragment for fragment in expected if fragment not in found and fragment not in output
+    ]
+    assert not missing, f"Missing from output: {missing}"
 
 
 class TestCLIHelp:
     """Test CLI help and version commands."""
 
-    def test_main_help(self):
+    def test_main_help(self, app):
         """Test main CLI help."""
         result = runner.invoke(app, ["--help"])
         assert result.exit_code == 0
-        assert "Parse and export Microsoft Access Database files" in result.stdout
-        assert "info" in result.stdout
-        assert "tables" in result.stdout
-        assert "export" in result.stdout
-
-    def test_version_command(self):
+        assert_output_contains(
+            result.stdout,
+            "Parse and export Microsoft Access Database files",
+            "info",
+            "tables",
+            "export",
+        )
+
+    def test_version_command(self, app):
         """Test version command."""
         result = runner.invoke(app, ["version"])
         assert result.exit_code == 0
-        assert "MerlinDB" in result.stdout
-        assert "v1.0.0" in result.stdout
+        assert_output_contains(
+            result.stdout,
+            "MerlinDB",
+            "v1.0.0",
+        )
 
-    def test_command_help(self):
+    def test_command_help(self, app):
         """Test individual command help."""
         commands = ["info", "tables", "inspect", "export", "validate"]
 
@@ -48,23 +85,29 @@ class TestCLIHelp:
 class TestInfoCommand:
     """Test the info command."""
 
-    def test_info_basic(self):
+    def test_info_basic(self, app):
         """Test basic info command."""
         result = runner.invoke(app, ["info", TEST_DB_PATH])
         assert result.exit_code == 0
-        assert "MerlinDB Info" in result.stdout
-        assert "Total Tables: 64" in result.stdout
-        assert "Total Records: 2,512" in result.stdout
-
-    def test_info_verbose(self):
+        assert_output_contains(
+            result.stdout,
+            "MerlinDB Info",
+            "Total Tables: 64",
+            "Total Records: 2,512",
+        )
+
+    def test_info_verbose(self, app):
         """Test verbose info command."""
         result = runner.invoke(app, ["info", TEST_DB_PATH, "--verbose"])
         assert result.exit_code == 0
-        assert "Table Details:" in result.stdout
-        assert "Config" in result.stdout
-        assert "GeniSysButtonFunctions" in result.stdout  # This appears in first 20 tables
-
-    def test_info_invalid_file(self):
+        assert_output_contains(
+            result.stdout,
+            "Table Details:",
+            "Config",
+            "GeniSysButtonFunctions",  # This appears in first 20 tables
+        )
+
+    def test_info_invalid_file(self, app):
         """Test info with invalid file."""
         result = runner.invoke(app, ["info", "nonexistent.mdb"])
         assert result.exit_code == 1
@@ -74,31 +117,40 @@ class TestInfoCommand:
 class TestTablesCommand:
     """Test the tables command."""
 
-    def test_tables_list_all(self):
+    def test_tables_list_all(self, app):
         """Test listing all tables."""
         result = runner.invoke(app, ["tables", TEST_DB_PATH])
         assert result.exit_code == 0
-        assert "Available Tables (64)" in result.stdout
-        assert "Config" in result.stdout
-        assert "GeniSysObjects" in result.stdout
-
-    def test_tables_with_pattern(self):
+        assert_output_contains(
+            result.stdout,
+            "Available Tables (64)",
+            "Config",
+            "GeniSysObjects",
+        )
+
+    def test_tables_with_pattern(self, app):
         """Test table filtering with pattern."""
         result = runner.invoke(app, ["tables", TEST_DB_PATH, "--pattern", "GeniSys*"])
         assert result.exit_code == 0
-        assert "Available Tables (3)" in result.stdout
-        assert "GeniSysObjects" in result.stdout
-        assert "Filtered by pattern: GeniSys*" in result.stdout
-
-    def test_tables_with_info(self):
+        assert_output_contains(
+            result.stdout,
+            "Available Tables (3)",
+            "GeniSysObjects",
+            "Filtered by pattern: GeniSys*",
+        )
+
+    def test_tables_with_info(self, app):
         """Test table listing with detailed info."""
         result = runner.invoke(app, ["tables", TEST_DB_PATH, "--info"])
         assert result.exit_code == 0
-        assert "Table Name" in result.stdout
-        assert "Records" in result.stdout
-        assert "Columns" in result.stdout
-
-    def test_tables_no_match_pattern(self):
+        assert_output_contains(
+            result.stdout,
+            "Table Name",
+            "Records",
+            "Columns",
+        )
+
+    def test_tables_no_match_pattern(self, app):
         """Test pattern with no matches."""
         result = runner.invoke(app, ["tables", TEST_DB_PATH, "--pattern", "NonExistent*"])
         assert result.exit_code == 0
@@ -108,33 +160,36 @@ class TestTablesCommand:
 class TestInspectCommand:
     """Test the inspect command."""
 
-    def test_inspect_basic(self):
+    def test_inspect_basic(self, app):
         """Test basic table inspection."""
         result = runner.invoke(app, ["inspect", TEST_DB_PATH, "Config"])
         assert result.exit_code == 0
-        assert "Table: Config" in result.stdout
-        assert "Records: 1" in result.stdout
-        assert "Pydantic validation available" in result.stdout
-
-    def test_inspect_with_validation(self):
+        assert_output_contains(
+            result.stdout,
+            "Table: Config",
+            "Records: 1",
+            "Pydantic validation available",
+        )
+
+    def test_inspect_with_validation(self, app):
         """Test inspection with validation."""
         result = runner.invoke(app, ["inspect", TEST_DB_PATH, "Config", "--validate"])
         assert result.exit_code == 0
         assert "Table: Config" in result.stdout
 
-    def test_inspect_with_limit(self):
+    def test_inspect_with_limit(self, app):
         """Test inspection with record limit."""
         result = runner.invoke(app, ["inspect", TEST_DB_PATH, "Config", "--limit", "5"])
         assert result.exit_code == 0
         assert "Sample Data" in result.stdout
 
-    def test_inspect_invalid_table(self):
+    def test_inspect_invalid_table(self, app):
         """Test inspection with invalid table name."""
         result = runner.invoke(app, ["inspect", TEST_DB_PATH, "NonExistentTable"])
         assert result.exit_code == 1
         assert "Table 'NonExistentTable' not found" in result.stdout
 
-    def test_inspect_suggestions(self):
+    def test_inspect_suggestions(self, app):
         """Test inspection with similar table name suggestions."""
         result = runner.invoke(app, ["inspect", TEST_DB_PATH, "config"])  # lowercase
         assert result.exit_code == 1
@@ -144,142 +199,146 @@ class TestInspectCommand:
 class TestExportCommand:
     """Test the export command."""
 
-    def test_export_json_single_table(self):
+    def test_export_json_single_table(self, app, tmp_path):
         """Test JSON export of single table."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.json"
+        output_file = tmp_path / "test.json"
 
-            result = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config"]
-            )
-
-            assert result.exit_code == 0
-            assert "Export completed successfully!" in result.stdout
-            assert "Format: JSON" in result.stdout
-            assert "Tables exported: 1" in result.stdout
-            assert output_file.exists()
+        result = runner.invoke(app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config"])
 
-    def test_export_yaml_multiple_tables(self):
+        assert result.exit_code == 0
+        assert_output_contains(
+            result.stdout,
+            "Export completed successfully!",
+            "Format: JSON",
+            "Tables exported: 1",
+        )
+        assert output_file.exists()
+
+    def test_export_yaml_multiple_tables(self, app, tmp_path):
         """Test YAML export of multiple tables."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.yaml"
-
-            result = runner.invoke(
-                app,
-                [
-                    "export",
-                    TEST_DB_PATH,
-                    str(output_file),
-                    "--format",
-                    "yaml",
-                    "--table",
-                    "Config",
-                    "--table",
-                    "DeviceTypes",
-                ],
-            )
+        output_file = tmp_path / "test.yaml"
+
+        result = runner.invoke(
+            app,
+            [
+                "export",
+                TEST_DB_PATH,
+                str(output_file),
+                "--format",
+                "yaml",
+                "--table",
+                "Config",
+                "--table",
+                "DeviceTypes",
+            ],
+        )
 
-            assert result.exit_code == 0
-            assert "Format: YAML" in result.stdout
-            assert "Tables exported: 2" in result.stdout
+        assert result.exit_code == 0
+        assert_output_contains(
+            result.stdout,
+            "Format: YAML",
+            "Tables exported: 2",
+        )
 
-    def test_export_csv_separate_files(self):
+    def test_export_csv_separate_files(self, app, tmp_path):
         """Test CSV export to separate files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.csv"
-
-            result = runner.invoke(
-                app,
-                [
-                    "export",
-                    TEST_DB_PATH,
-                    str(output_file),
-                    "--format",
-                    "csv",
-                    "--table",
-                    "Config",
-                    "--table",
-                    "DeviceTypes",
-                    "--separate",
-                ],
-            )
+        output_file = tmp_path / "test.csv"
+
+        result = runner.invoke(
+            app,
+            [
+                "export",
+                TEST_DB_PATH,
+                str(output_file),
+                "--format",
+                "csv",
+                "--table",
+                "Config",
+                "--table",
+                "DeviceTypes",
+                "--separate",
+            ],
+        )
 
-            assert result.exit_code == 0
-            assert "Format: CSV" in result.stdout
-            assert "Tables exported: 2" in result.stdout
+        assert result.exit_code == 0
+        assert_output_contains(
+            result.stdout,
+            "Format: CSV",
+            "Tables exported: 2",
+        )
 
-    def test_export_with_validation(self):
+    def test_export_with_validation(self, app, tmp_path):
         """Test export with Pydantic validation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "validated.json"
+        output_file = tmp_path / "validated.json"
 
-            result = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config", "--validate"]
-            )
+        result = runner.invoke(
+            app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config", "--validate"]
+        )
 
-            assert result.exit_code == 0
-            assert "Export completed successfully!" in result.stdout
+        assert result.exit_code == 0
+        assert "Export completed successfully!" in result.stdout
 
-    def test_export_wildcards(self):
+    def test_export_wildcards(self, app, tmp_path):
         """Test export with wildcard patterns."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "genisys.json"
+        output_file = tmp_path / "genisys.json"
 
-            result = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "GeniSys*"]
-            )
+        result = runner.invoke(
+            app, ["export", TEST_DB_PATH, str(output_file), "--table", "GeniSys*"]
+        )
 
-            assert result.exit_code == 0
-            assert "Tables exported: 3" in result.stdout
+        assert result.exit_code == 0
+        assert "Tables exported: 3" in result.stdout
 
-    def test_export_all_tables(self):
+    def test_export_all_tables(self, app, tmp_path):
         """Test export of all tables."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "all.json"
+        output_file = tmp_path / "all.json"
 
-            result = runner.invoke(app, ["export", TEST_DB_PATH, str(output_file)])
+        result = runner.invoke(app, ["export", TEST_DB_PATH, str(output_file)])
 
-            assert result.exit_code == 0
-            assert "Tables exported: 64" in result.stdout
+        assert result.exit_code == 0
+        assert "Tables exported: 64" in result.stdout
 
-    def test_export_invalid_format(self):
+    def test_export_invalid_format(self, app, tmp_path):
         """Test export with invalid format."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "test.xml"
+        output_file = tmp_path / "test.xml"
 
-            result = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--format", "xml"]
-            )
+        result = runner.invoke(app, ["export", TEST_DB_PATH, str(output_file), "--format", "xml"])
 
-            assert result.exit_code == 1
-            assert "Export failed:" in result.stdout
+        assert result.exit_code == 1
+        assert "Export failed:" in result.stdout
 
 
 class TestValidateCommand:
     """Test the validate command."""
 
-    def test_validate_all_tables(self):
+    def test_validate_all_tables(self, app):
         """Test validation of all tables."""
         result = runner.invoke(app, ["validate", TEST_DB_PATH])
         assert result.exit_code == 0
-        assert "Validation Results:" in result.stdout
-        assert "Config:" in result.stdout
+        assert_output_contains(
+            result.stdout,
+            "Validation Results:",
+            "Config:",
+        )
 
-    def test_validate_specific_table(self):
+    def test_validate_specific_table(self, app):
         """Test validation of specific table."""
         result = runner.invoke(app, ["validate", TEST_DB_PATH, "--table", "Config"])
         assert result.exit_code == 0
         assert "Config:" in result.stdout
 
-    def test_validate_summary_only(self):
+    def test_validate_summary_only(self, app):
         """Test validation summary."""
         result = runner.invoke(app, ["validate", TEST_DB_PATH, "--summary"])
         assert result.exit_code == 0
-        assert "Validation Summary" in result.stdout
-        assert "Validated Successfully:" in result.stdout
-        assert "63 tables" in result.stdout
-
-    def test_validate_invalid_table(self):
+        assert_output_contains(
+            result.stdout,
+            "Validation Summary",
+            "Validated Successfully:",
+            "63 tables",
+        )
+
+    def test_validate_invalid_table(self, app):
         """Test validation with invalid table."""
         result = runner.invoke(app, ["validate", TEST_DB_PATH, "--table", "NonExistent"])
         assert result.exit_code == 0  # Should continue with warning
@@ -289,21 +348,22 @@ class TestValidateCommand:
 class TestErrorHandling:
     """Test CLI error handling."""
 
-    def test_invalid_database_file(self):
-        """Test commands with invalid database file."""
-        commands_to_test = [
+    @pytest.mark.parametrize(
+        "cmd",
+        [
             ["info", "nonexistent.mdb"],
             ["tables", "nonexistent.mdb"],
             ["inspect", "nonexistent.mdb", "Config"],
             ["validate", "nonexistent.mdb"],
-        ]
-
-        for cmd in commands_to_test:
-            result = runner.invoke(app, cmd)
-            assert result.exit_code == 1
-            assert "Error:" in result.stdout
+        ],
+    )
+    def test_invalid_database_file(self, app, cmd):
+        """Test commands with invalid database file."""
+        result = runner.invoke(app, cmd)
+        assert result.exit_code == 1
+        assert "Error:" in result.stdout
 
-    def test_missing_arguments(self):
+    def test_missing_arguments(self, app):
         """Test commands with missing required arguments."""
         # Missing database file
         result = runner.invoke(app, ["info"])
@@ -321,7 +381,7 @@ class TestErrorHandling:
 class TestIntegration:
     """Integration tests combining multiple CLI operations."""
 
-    def test_workflow_inspect_then_export(self):
+    def test_workflow_inspect_then_export(self, app, tmp_path):
         """Test workflow: inspect table then export it."""
         # First inspect
         result1 = runner.invoke(app, ["inspect", TEST_DB_PATH, "Config", "--limit", "0"])
@@ -329,17 +389,16 @@ class TestIntegration:
         assert "Table: Config" in result1.stdout
 
         # Then export based on inspection
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "config.json"
+        output_file = tmp_path / "config.json"
 
-            result2 = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config"]
-            )
+        result2 = runner.invoke(
+            app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config"]
+        )
 
-            assert result2.exit_code == 0
-            assert output_file.exists()
+        assert result2.exit_code == 0
+        assert output_file.exists()
 
-    def test_workflow_validate_then_export_with_validation(self):
+    def test_workflow_validate_then_export_with_validation(self, app, tmp_path):
         """Test workflow: validate table then export with validation."""
         # First validate
         result1 = runner.invoke(app, ["validate", TEST_DB_PATH, "--table", "Config"])
@@ -347,17 +406,16 @@ class TestIntegration:
         assert "Config:" in result1.stdout
 
         # Then export with validation
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "validated_config.json"
+        output_file = tmp_path / "validated_config.json"
 
-            result2 = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config", "--validate"]
-            )
+        result2 = runner.invoke(
+            app, ["export", TEST_DB_PATH, str(output_file), "--table", "Config", "--validate"]
+        )
 
-            assert result2.exit_code == 0
-            assert output_file.exists()
+        assert result2.exit_code == 0
+        assert output_file.exists()
 
-    def test_workflow_info_tables_export(self):
+    def test_workflow_info_tables_export(self, app, tmp_path):
         """Test workflow: get info, list tables, then export filtered tables."""
         # Get info
         result1 = runner.invoke(app, ["info", TEST_DB_PATH])
@@ -368,21 +426,20 @@ class TestIntegration:
         assert result2.exit_code == 0
 
         # Export filtered tables
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_file = Path(temp_dir) / "genisys_export.json"
+        output_file = tmp_path / "genisys_export.json"
 
-            result3 = runner.invoke(
-                app, ["export", TEST_DB_PATH, str(output_file), "--table", "GeniSys*"]
-            )
+        result3 = runner.invoke(
+            app, ["export", TEST_DB_PATH, str(output_file), "--table", "GeniSys*"]
+        )
 
-            assert result3.exit_code == 0
-            assert output_file.exists()
+        assert result3.exit_code == 0
+        assert output_file.exists()
 
 
 class TestOutputFormatting:
     """Test CLI output formatting and styling."""
 
-    def test_rich_formatting_in_output(self):
+    def test_rich_formatting_in_output(self, app):
         """Test that Rich formatting works correctly."""
         result = runner.invoke(app, ["info", TEST_DB_PATH])
         assert result.exit_code == 0
@@ -391,10 +448,13 @@ class TestOutputFormatting:
         assert "MerlinDB Info" in result.stdout
         assert "📁" in result.stdout or "File:" in result.stdout  # Emojis may not render in tests
 
-    def test_table_formatting(self):
+    def test_table_formatting(self, app):
         """Test table formatting in verbose output."""
         result = runner.invoke(app, ["tables", TEST_DB_PATH, "--info"])
         assert result.exit_code == 0
         # Should contain table headers
-        assert "Table Name" in result.stdout
-        assert "Records" in result.stdout
+        assert_output_contains(
+            result.stdout,
+            "Table Name",
+            "Records",
+        )
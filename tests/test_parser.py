@@ -1,18 +1,19 @@
 """Test core parser functionality with real MDB data."""
 
-import logging
+import os
+from collections import defaultdict
+from typing import Any
 
 import pytest
 
-# Suppress access-parser logging during tests
-logging.getLogger("access_parser").setLevel(logging.ERROR)
-
-from merlindb.models.genisys import model_map
 from merlindb.parser import (
     _validate_table_data,
     get_available_tables,
     get_mdb,
     get_table_data,
+    get_table_names,
+    get_table_row_count,
+    parse_tables_parallel,
     table_to_dicts,
 )
 
@@ -20,6 +21,27 @@ from merlindb.parser import (
 TEST_DB_PATH = "test.mdb"
 
 
+def _collect_table_names() -> list[Any]:
+    """Read the test database's table names at collection time.
+
+    If they can't be read, the error becomes a single case that the table_name
+    fixture re-raises, so the tests fail loudly instead of being skipped for an
+    empty parameter set.
+    """
+    try:
+        return get_table_names(TEST_DB_PATH)
+    except ValueError as e:
+        return [pytest.param(e, id="unreadable-test-db")]
+
+
+@pytest.fixture
+def table_name(request):
+    """Table name parametrized from _collect_table_names(), re-raising a read failure."""
+    if isinstance(request.param, Exception):
+        raise request.param
+    return request.param
+
+
 def test_get_mdb_success():
     """Test successful MDB file loading."""
     db = get_mdb(TEST_DB_PATH)
@@ -28,17 +50,23 @@ def test_get_mdb_success():
     assert len(db.catalog) > 0
 
 
+def test_get_mdb_reuses_parser_for_same_file(db, monkeypatch, tmp_path):
+    """Test that different spellings of a path share one cached parser."""
+    assert get_mdb(os.path.join(".", TEST_DB_PATH)) is db
+
+    # A relative path resolves against the working directory at call time
+    monkeypatch.chdir(tmp_path)
+    assert get_mdb(TEST_DB_PATH) is None
+
+
 def test_get_mdb_invalid_file():
     """Test MDB loading with non-existent file."""
     db = get_mdb("nonexistent.mdb")
     assert db is None
 
 
-def test_get_available_tables():
+def test_get_available_tables(db):
     """Test retrieving available table names."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
-
     tables = get_available_tables(db)
     assert isinstance(tables, list)
     assert len(tables) > 0
@@ -46,17 +74,22 @@ def test_get_available_tables():
     assert tables == sorted(tables)  # Should be sorted
 
 
-def test_get_table_data_without_validation():
-    """Test retrieving table data without Pydantic validation."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
+def test_get_table_names(available_tables):
+    """Test that the catalog-only table listing matches the full parser."""
+    assert get_table_names(TEST_DB_PATH) == available_tables
+
+    with pytest.raises(ValueError, match="Failed to load MDB file"):
+        get_table_names("nonexistent.mdb")
+
 
+def test_get_table_data_without_validation(db, available_tables):
+    """Test retrieving table data without Pydantic validation."""
     # Test with a known table that might not have Pydantic model
     table_data = get_table_data(db, "Config", validate=False)
     assert isinstance(table_data, dict)
 
     # Test with Config table specifically
-    if "Config" in get_available_tables(db):
+    if "Config" in available_tables:
         config_data = get_table_data(db, "Config", validate=False)
         assert isinstance(config_data, dict)
         # Should have column names as keys
@@ -64,42 +97,63 @@ def test_get_table_data_without_validation():
             assert isinstance(values, list)
 
 
-def test_get_table_data_invalid_table():
+def test_get_table_data_invalid_table(db):
     """Test error handling for invalid table names."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
-
     with pytest.raises(ValueError, match="Table 'NonExistentTable' not found"):
         get_table_data(db, "NonExistentTable")
 
 
-def test_get_table_data_with_validation():
+@pytest.mark.parametrize("table_name", _collect_table_names(), indirect=True)
+def test_get_table_row_count(db, table_cache, table_name):
+    """Test that every table's header row count matches its parsed data."""
+    table_data = get_table_data(db, table_name, validate=False, cache=table_cache)
+    first_column = next(iter(table_data.values()), [])
+    assert get_table_row_count(db, table_name) == len(first_column)
+
+
+def test_get_table_row_count_missing_table(db):
+    """Test header row count lookup for a table that doesn't exist."""
+    with pytest.raises(ValueError, match="Table 'NonExistentTable' not found"):
+        get_table_row_count(db, "NonExistentTable")
+
+
+def test_get_table_data_with_validation(db, first_modeled_table, table_cache):
     """Test table data retrieval with Pydantic validation."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
+    # Test with validation enabled
+    validated_data = get_table_data(db, first_modeled_table, validate=True, cache=table_cache)
+    assert isinstance(validated_data, dict)
+
+    # Test without validation for comparison
+    raw_data = get_table_data(db, first_modeled_table, validate=False, cache=table_cache)
+    assert isinstance(raw_data, dict)
+
+    # Both should have same column structure
+    assert validated_data.keys() == raw_data.keys()
+
+
+def test_get_table_data_empty_table_columns_are_lists():
+    """Test that empty tables come back as empty column lists, cached or not."""
+
+    class EmptyTableDB:
+        catalog = {"Empty": 0}
 
-    # Find a table that has a Pydantic model
-    available_tables = get_available_tables(db)
-    test_table = None
+        def parse_table(self, table_name):
+            # access_parser's shape for a table without rows
+            return defaultdict(list, {"a": "", "b": ""})
 
-    for table_name in available_tables:
-        if table_name in model_map:
-            test_table = table_name
-            break
+    db = EmptyTableDB()
+    expected = {"a": [], "b": []}
 
-    if test_table:
-        # Test with validation enabled
-        validated_data = get_table_data(db, test_table, validate=True)
-        assert isinstance(validated_data, dict)
+    assert get_table_data(db, "Empty", validate=False) == expected
+    assert get_table_data(db, "Empty", validate=False, cache={}) == expected
 
-        # Test without validation for comparison
-        raw_data = get_table_data(db, test_table, validate=False)
-        assert isinstance(raw_data, dict)
 
-        # Both should have same column structure
-        assert set(validated_data.keys()) == set(raw_data.keys())
-    else:
-        pytest.skip("No tables with Pydantic models found in test data")
+def test_parse_tables_parallel_arguments():
+    """Test parse_tables_parallel with no tables and with an invalid worker count."""
+    assert parse_tables_parallel(TEST_DB_PATH, [], workers=2) == {}
+
+    with pytest.raises(ValueError, match="workers must be at least 1, got 0"):
+        parse_tables_parallel(TEST_DB_PATH, ["Config"], workers=0)
 
 
 def test_table_to_dicts_basic():
@@ -114,6 +168,26 @@ def test_table_to_dicts_basic():
     ]
 
     assert result == expected
+    assert list(result[0]) == cols
+
+
+def test_table_to_dicts_large():
+    """Test table_to_dicts on a wider, taller table."""
+    cols = [f"c{i}" for i in range(32)]
+    rows = [list(range(i, i + 1000)) for i in range(len(cols))]
+
+    result = table_to_dicts(cols, rows)
+
+    assert len(result) == 1000
+    assert list(result[-1]) == cols
+    assert result[-1]["c31"] == 31 + 999
+
+
+def test_table_to_dicts_uneven_columns():
+    """Test that rows stop at the shortest column instead of padding with None."""
+    result = table_to_dicts(["name", "age"], [["Alice", "Bob", "Carol"], [25, 30]])
+
+    assert result == [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
 
 
 def test_table_to_dicts_empty_data():
@@ -125,13 +199,9 @@ def test_table_to_dicts_empty_data():
     assert table_to_dicts(["col1", "col2"], []) == []
 
 
-def test_table_to_dicts_with_real_data():
+def test_table_to_dicts_with_real_data(db, available_tables):
     """Test table_to_dicts with real MDB data."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
-
     # Get data from a small table for testing
-    available_tables = get_available_tables(db)
     test_table = available_tables[0]  # Use first available table
 
     table_data = get_table_data(db, test_table, validate=False)
@@ -144,69 +214,66 @@ def test_table_to_dicts_with_real_data():
 
         if result:  # If table has data
             assert isinstance(result[0], dict)
-            assert set(result[0].keys()) == set(cols)
+            assert result[0].keys() == set(cols)
 
 
-def test_validate_table_data_function():
+def test_validate_table_data_function(db, first_modeled_table, table_cache):
     """Test the _validate_table_data function directly."""
-    # Find a table with a Pydantic model for testing
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
+    # Get raw data
+    raw_data = get_table_data(db, first_modeled_table, validate=False, cache=table_cache)
 
-    available_tables = get_available_tables(db)
-    test_table = None
+    # Test validation function
+    validated_data = _validate_table_data(first_modeled_table, raw_data)
+    assert isinstance(validated_data, dict)
+    assert validated_data.keys() == raw_data.keys()
 
-    for table_name in available_tables:
-        if table_name in model_map:
-            test_table = table_name
-            break
 
-    if test_table:
-        # Get raw data
-        raw_data = get_table_data(db, test_table, validate=False)
+def test_validate_table_data_keeps_failed_rows_raw():
+    """Test that rows failing validation keep their raw values in every column."""
+    raw_data = {
+        "AVManufacturer_ID": ["1", "bad", 3],
+        "Manufacturer": ["Sony", "LG", None],
+    }
 
-        # Test validation function
-        validated_data = _validate_table_data(test_table, raw_data)
-        assert isinstance(validated_data, dict)
-        assert set(validated_data.keys()) == set(raw_data.keys())
-    else:
-        pytest.skip("No tables with Pydantic models found for validation testing")
+    validated_data = _validate_table_data("AVManufacturer", raw_data)
 
+    assert validated_data == {
+        "AVManufacturer_ID": [1, "bad", 3],
+        "Manufacturer": ["Sony", "LG", None],
+    }
 
-def test_integration_all_tables_accessible():
-    """Integration test: verify all tables can be accessed without errors."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
 
-    available_tables = get_available_tables(db)
-    accessible_count = 0
-    error_tables = []
+def test_validate_table_data_uneven_columns():
+    """Test that validated rows stop at the shortest column instead of padding with None."""
+    raw_data = {"AVManufacturer_ID": [1, 2, 3], "Manufacturer": ["Sony", "LG"]}
 
-    for table_name in available_tables:
-        try:
-            data = get_table_data(db, table_name, validate=False)
-            assert isinstance(data, dict)
-            accessible_count += 1
-        except Exception as e:
-            error_tables.append((table_name, str(e)))
+    validated_data = _validate_table_data("AVManufacturer", raw_data)
 
-    # Most tables should be accessible
-    assert accessible_count > len(available_tables) * 0.8  # At least 80% accessible
+    assert validated_data == {"AVManufacturer_ID": [1, 2], "Manufacturer": ["Sony", "LG"]}
 
-    if error_tables:
-        print(f"Tables with access errors: {error_tables[:5]}")
 
+def test_validate_table_data_empty_table():
+    """Test validating an empty table in access_parser's shape, with "" for each column."""
+    raw_data = {"AVManufacturer_ID": "", "Manufacturer": ""}
 
-## Tests for specific test.mdb tables
+    validated_data = _validate_table_data("AVManufacturer", raw_data)
 
+    assert validated_data == {"AVManufacturer_ID": [], "Manufacturer": []}
 
-def test_known_tables_exist():
-    """Test that known tables from list_tables.py exist."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
 
-    available_tables = get_available_tables(db)
-    known_tables = [
+@pytest.mark.parametrize("table_name", _collect_table_names(), indirect=True)
+def test_integration_all_tables_accessible(db, table_name):
+    """Integration test: verify each table can be accessed without errors."""
+    data = get_table_data(db, table_name, validate=False)
+    assert isinstance(data, dict)
+
+
+## Tests for specific test.mdb tables
+
+
+@pytest.mark.parametrize(
+    "table_name",
+    [
         "GeniSysObjects",
         "Config",
         "DeviceTypes",
@@ -215,18 +282,16 @@ def test_known_tables_exist():
         "Events",
         "ProjectName",
         "Version",
-    ]
-
-    for table_name in known_tables:
-        assert table_name in available_tables, f"Expected table '{table_name}' not found"
+    ],
+)
+def test_known_tables_exist(available_tables, table_name):
+    """Test that known tables from list_tables.py exist."""
+    assert table_name in available_tables, f"Expected table '{table_name}' not found"
 
 
-def test_config_table_structure():
+def test_config_table_structure(db, available_tables):
     """Test the Config table structure (commonly available)."""
-    db = get_mdb(TEST_DB_PATH)
-    assert db is not None
-
-    if "Config" in get_available_tables(db):
+    if "Config" in available_tables:
         config_data = get_table_data(db, "Config", validate=False)
         assert isinstance(config_data, dict)
         # Config table should have some columns